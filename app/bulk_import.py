@@ -0,0 +1,45 @@
+import argparse
+import os
+from dotenv import load_dotenv
+from app.pipelines.export_admin_import import run_admin_import
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Bulk load the movies and credits CSV files into a stopped Neo4j database with "
+            "neo4j-admin. Run it on the database host, then start the database again."
+        )
+    )
+    parser.add_argument("--neo4j-admin", default="neo4j-admin", help="Path to the neo4j-admin executable.")
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace the database if it already exists, deleting all its data.",
+    )
+    args = parser.parse_args()
+
+    try:
+        load_dotenv()
+
+        neo4j_db_name = os.getenv("NEO4J_DB_NAME", "movies")
+        movies_csv_path = os.getenv("MOVIES_DATASET_CSV_PATH", "data/tmdb_5000_movies.csv")
+        credits_csv_path = os.getenv("CREDITS_DATASET_CSV_PATH", "data/tmdb_5000_credits.csv")
+
+        print(f"Bulk importing {movies_csv_path} and {credits_csv_path} into database {neo4j_db_name} ...")
+        movies_count, credits_count = run_admin_import(
+            movies_csv_path,
+            credits_csv_path,
+            neo4j_db_name,
+            neo4j_admin=args.neo4j_admin,
+            overwrite=args.overwrite,
+        )
+        print(f"Imported {movies_count} movies and {credits_count} credits.")
+        print(f"Start the database to use it, e.g. with: START DATABASE {neo4j_db_name}")
+
+    except Exception as e:
+        print(f"Error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()
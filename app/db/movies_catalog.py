@@ -1,8 +1,324 @@
 import math
-import pandas as pd
-from neo4j import GraphDatabase, Record
-from app.pipelines.transform_credits import transform_credits
-from app.pipelines.transform_movies import transform_movies
+import os
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import ExitStack, contextmanager
+from cachetools import TTLCache
+from neo4j import GraphDatabase, Record, Session
+from app.pipelines.read_csv import CREDITS_CSV_COLUMNS, MOVIES_CSV_COLUMNS, read_csv_chunks
+from app.pipelines.transform_credits import flatten_credits_columns, transform_credits_columns
+from app.pipelines.transform_movies import flatten_movies_columns, transform_movies_columns
+
+
+# Number of leading bytes of a CSV file sampled to estimate its row count
+_COUNT_SAMPLE_SIZE = 64 << 10
+
+# Maximum number of read query results kept in memory, and how long they stay valid in seconds
+_READ_CACHE_SIZE = 1024
+_READ_CACHE_TTL = 60
+
+# Constraints and indexes backing the MERGE keys used during imports
+_SCHEMA_STATEMENTS = [
+    "CREATE CONSTRAINT movie_id IF NOT EXISTS FOR (m:Movie) REQUIRE m.movie_id IS UNIQUE",
+    "CREATE CONSTRAINT person_id IF NOT EXISTS FOR (p:Person) REQUIRE p.person_id IS UNIQUE",
+    "CREATE CONSTRAINT genre_name IF NOT EXISTS FOR (g:Genre) REQUIRE g.name IS UNIQUE",
+    "CREATE CONSTRAINT keyword_name IF NOT EXISTS FOR (k:Keyword) REQUIRE k.name IS UNIQUE",
+    "CREATE CONSTRAINT production_company_name IF NOT EXISTS FOR (pc:ProductionCompany) REQUIRE pc.name IS UNIQUE",
+    # Countries and languages are merged on (iso_code, name), so index iso_code without enforcing uniqueness
+    "CREATE INDEX country_iso_code IF NOT EXISTS FOR (c:Country) ON (c.iso_code)",
+    "CREATE INDEX language_iso_code IF NOT EXISTS FOR (l:Language) ON (l.iso_code)",
+    # Lowercase copies of searched properties, so queries do not call toLower per node
+    "CREATE INDEX person_name_lc IF NOT EXISTS FOR (p:Person) ON (p.name_lc)",
+    "CREATE INDEX genre_name_lc IF NOT EXISTS FOR (g:Genre) ON (g.name_lc)",
+    "CREATE INDEX keyword_name_lc IF NOT EXISTS FOR (k:Keyword) ON (k.name_lc)",
+    "CREATE INDEX country_iso_code_lc IF NOT EXISTS FOR (c:Country) ON (c.iso_code_lc)",
+    # Exact name and title lookups of link_actor_to_movie and unlink_actor_from_movie. Range
+    # indexes, as text indexes are not used for equality against parameter values of any type.
+    "DROP INDEX person_name_text IF EXISTS",
+    "DROP INDEX movie_title_text IF EXISTS",
+    "CREATE INDEX person_name IF NOT EXISTS FOR (p:Person) ON (p.name)",
+    "CREATE INDEX movie_title IF NOT EXISTS FOR (m:Movie) ON (m.title)",
+    # Fulltext indexes of earlier versions, replaced by the text indexes below
+    "DROP INDEX person_name_fulltext IF EXISTS",
+    "DROP INDEX genre_name_fulltext IF EXISTS",
+    "DROP INDEX keyword_name_fulltext IF EXISTS",
+    # Text indexes backing the CONTAINS searches of the find_* queries on the lowercase names
+    "CREATE TEXT INDEX person_name_lc_text IF NOT EXISTS FOR (p:Person) ON (p.name_lc)",
+    "CREATE TEXT INDEX genre_name_lc_text IF NOT EXISTS FOR (g:Genre) ON (g.name_lc)",
+    "CREATE TEXT INDEX keyword_name_lc_text IF NOT EXISTS FOR (k:Keyword) ON (k.name_lc)",
+]
+
+# Cypher queries setting the lowercase copies missing from nodes imported before they were
+# stored, so the find_* queries match them too. Each commits in batches of $batch_size nodes.
+_BACKFILL_QUERIES = [
+    f"""
+    MATCH (n:{label}) WHERE n.{lc_prop} IS NULL AND n.{prop} IS NOT NULL
+    CALL {{
+        WITH n
+        SET n.{lc_prop} = toLower(n.{prop})
+    }} IN TRANSACTIONS OF $batch_size ROWS
+    RETURN count(*) as total
+"""
+    for label, prop, lc_prop in [
+        ("Person", "name", "name_lc"),
+        ("Genre", "name", "name_lc"),
+        ("Keyword", "name", "name_lc"),
+        ("Country", "iso_code", "iso_code_lc"),
+    ]
+]
+
+
+# Cypher clause iterating over the index i of column list parameters holding $size rows
+_UNWIND_COLUMNS = """
+    UNWIND range(0, $size - 1) AS i"""
+
+# Cypher clause returning the number of rows processed by a column list query
+_RETURN_COUNT = """
+    RETURN count(*) as total
+"""
+
+# Cypher statement merging the movie at index i of the column lists
+_ADD_MOVIE_STATEMENT = """
+    MERGE (m:Movie {movie_id: $id[i]})
+      ON CREATE SET m.title = $title[i],
+                    m.original_title = $original_title[i],
+                    m.release_date = $release_date[i],
+                    m.status = $status[i],
+                    m.runtime = $runtime[i],
+                    m.budget = $budget[i],
+                    m.revenue = $revenue[i],
+                    m.homepage = $homepage[i],
+                    m.tagline = $tagline[i],
+                    m.overview = $overview[i],
+                    m.popularity = $popularity[i],
+                    m.vote_average = $vote_average[i],
+                    m.vote_count = $vote_count[i]
+"""
+
+# Cypher query to merge movies from column lists
+_ADD_MOVIES_QUERY = _UNWIND_COLUMNS + _ADD_MOVIE_STATEMENT + _RETURN_COUNT
+
+# Related nodes of a movie, keyed by movie column. Each entry holds a Cypher statement merging
+# the distinct nodes of a chunk once, and a Cypher statement linking the already merged nodes
+# to movies, both at index i. They take one list parameter per item property flattened by
+# flatten_movies_columns, plus $movie_id for the links.
+_MOVIE_RELATIONS = {
+    "genres": (
+        """
+        MERGE (genre:Genre {name: $name[i]})
+          ON CREATE SET genre.name_lc = toLower($name[i])
+        """,
+        """
+        MATCH (m:Movie {movie_id: $movie_id[i]})
+        MATCH (genre:Genre {name: $name[i]})
+        MERGE (m)-[:HAS_GENRE]->(genre)
+        """,
+    ),
+    "keywords": (
+        """
+        MERGE (keyword:Keyword {name: $name[i]})
+          ON CREATE SET keyword.name_lc = toLower($name[i])
+        """,
+        """
+        MATCH (m:Movie {movie_id: $movie_id[i]})
+        MATCH (keyword:Keyword {name: $name[i]})
+        MERGE (m)-[:HAS_KEYWORD]->(keyword)
+        """,
+    ),
+    "production_companies": (
+        """
+        MERGE (:ProductionCompany {name: $name[i]})
+        """,
+        """
+        MATCH (m:Movie {movie_id: $movie_id[i]})
+        MATCH (pc:ProductionCompany {name: $name[i]})
+        MERGE (m)-[:PRODUCED_BY]->(pc)
+        """,
+    ),
+    "production_countries": (
+        """
+        MERGE (c:Country {iso_code: $iso_3166_1[i], name: $name[i]})
+          ON CREATE SET c.iso_code_lc = toLower($iso_3166_1[i])
+        """,
+        """
+        MATCH (m:Movie {movie_id: $movie_id[i]})
+        MATCH (c:Country {iso_code: $iso_3166_1[i], name: $name[i]})
+        MERGE (m)-[:PRODUCED_IN]->(c)
+        """,
+    ),
+    "spoken_languages": (
+        """
+        MERGE (:Language {iso_code: $iso_639_1[i], name: $name[i]})
+        """,
+        """
+        MATCH (m:Movie {movie_id: $movie_id[i]})
+        MATCH (l:Language {iso_code: $iso_639_1[i], name: $name[i]})
+        MERGE (m)-[:HAS_LANGUAGE]->(l)
+        """,
+    ),
+}
+
+# Cypher queries running the node and link statements of each relation over column lists
+_MOVIE_RELATION_QUERIES = {
+    column: tuple(_UNWIND_COLUMNS + statement + _RETURN_COUNT for statement in statements)
+    for column, statements in _MOVIE_RELATIONS.items()
+}
+
+# Cypher statements merging the person of a credit `row` and linking it to the row's movie,
+# keyed by credit kind. Directors and other crew members are told apart in Python, so each
+# statement is a plain MERGE without CASE branches.
+_CREDIT_STATEMENTS = {
+    "cast": """
+        MATCH (m:Movie {movie_id: row.movie_id})
+        MERGE (p:Person {person_id: row.person_id})
+          ON CREATE SET p.name = row.name,
+                        p.name_lc = toLower(row.name),
+                        p.gender = row.gender
+        MERGE (p)-[r:ACTED_IN]->(m)
+        SET r.character = row.character
+    """,
+    "directors": """
+        MATCH (m:Movie {movie_id: row.movie_id})
+        MERGE (p:Person {person_id: row.person_id})
+          ON CREATE SET p.name = row.name,
+                        p.name_lc = toLower(row.name),
+                        p.gender = row.gender
+        MERGE (p)-[:DIRECTED]->(m)
+    """,
+    "contributors": """
+        MATCH (m:Movie {movie_id: row.movie_id})
+        MERGE (p:Person {person_id: row.person_id})
+          ON CREATE SET p.name = row.name,
+                        p.name_lc = toLower(row.name),
+                        p.gender = row.gender
+        MERGE (p)-[r:CONTRIBUTED_TO]->(m)
+        SET r.job = row.job,
+            r.department = row.department,
+            r.credit_id = row.credit_id
+    """,
+}
+
+# Cypher queries running each credit statement over a list of rows
+_CREDIT_QUERIES = {
+    kind: "UNWIND $rows AS row" + statement for kind, statement in _CREDIT_STATEMENTS.items()
+}
+
+# Cypher query counting the credits rows whose movie exists
+_COUNT_CREDITS_QUERY = """
+    UNWIND $movie_id AS movie_id
+    MATCH (m:Movie {movie_id: movie_id})
+    RETURN count(*) as total
+"""
+
+# Cypher query running a credit statement through APOC, which splits the rows server-side
+# into batches of $batch_size rows, each committed in its own transaction. Batches run in
+# sequence, as credits of different rows share Movie and Person nodes and would deadlock.
+_APOC_ITERATE_QUERY = """
+    CALL apoc.periodic.iterate(
+        "UNWIND $rows AS row RETURN row",
+        $statement,
+        {batchSize: $batch_size, parallel: false, retries: 3, params: {rows: $rows}}
+    )
+    YIELD total, failedOperations, errorMessages
+    RETURN total, failedOperations, errorMessages
+"""
+
+# Number of person credits per transaction when importing through APOC
+_APOC_CREDITS_BATCH_SIZE = 1000
+
+# Cypher query running a statement over the index i of column lists through APOC, which
+# splits the $size rows server-side into batches of $batch_size rows, each committed in its
+# own transaction
+_APOC_ITERATE_COLUMNS_QUERY = """
+    CALL apoc.periodic.iterate(
+        "UNWIND range(0, $size - 1) AS i RETURN i",
+        $statement,
+        {batchSize: $batch_size, parallel: $parallel, retries: 3, params: $columns}
+    )
+    YIELD total, failedOperations, errorMessages
+    RETURN total, failedOperations, errorMessages
+"""
+
+# Number of movies, related nodes or movie relationships per transaction when importing through APOC
+_APOC_MOVIES_BATCH_SIZE = 1000
+
+# Cypher query loading movies and their related nodes from a CSV file read by the server
+# itself. JSON columns are parsed with APOC, and rows are committed in batches of $batch_size.
+_LOAD_MOVIES_CSV_QUERY = """
+    LOAD CSV WITH HEADERS FROM $url AS row
+    CALL {
+        WITH row
+        MERGE (m:Movie {movie_id: toInteger(row.id)})
+          ON CREATE SET m.title = row.title,
+                        m.original_title = row.original_title,
+                        m.release_date = CASE
+                            WHEN coalesce(row.release_date, '') = '' THEN null
+                            ELSE localdatetime({date: date(row.release_date)})
+                        END,
+                        m.status = row.status,
+                        m.runtime = toFloat(row.runtime),
+                        m.budget = toInteger(row.budget),
+                        m.revenue = toInteger(row.revenue),
+                        m.homepage = row.homepage,
+                        m.tagline = row.tagline,
+                        m.overview = row.overview,
+                        m.popularity = toFloat(row.popularity),
+                        m.vote_average = toFloat(row.vote_average),
+                        m.vote_count = toInteger(row.vote_count)
+        FOREACH (g IN apoc.convert.fromJsonList(coalesce(row.genres, '[]')) |
+            MERGE (genre:Genre {name: g.name})
+              ON CREATE SET genre.name_lc = toLower(g.name)
+            MERGE (m)-[:HAS_GENRE]->(genre)
+        )
+        FOREACH (k IN apoc.convert.fromJsonList(coalesce(row.keywords, '[]')) |
+            MERGE (keyword:Keyword {name: k.name})
+              ON CREATE SET keyword.name_lc = toLower(k.name)
+            MERGE (m)-[:HAS_KEYWORD]->(keyword)
+        )
+        FOREACH (c IN apoc.convert.fromJsonList(coalesce(row.production_companies, '[]')) |
+            MERGE (pc:ProductionCompany {name: c.name})
+            MERGE (m)-[:PRODUCED_BY]->(pc)
+        )
+        FOREACH (pc IN apoc.convert.fromJsonList(coalesce(row.production_countries, '[]')) |
+            MERGE (c:Country {iso_code: pc.iso_3166_1, name: pc.name})
+              ON CREATE SET c.iso_code_lc = toLower(pc.iso_3166_1)
+            MERGE (m)-[:PRODUCED_IN]->(c)
+        )
+        FOREACH (sl IN apoc.convert.fromJsonList(coalesce(row.spoken_languages, '[]')) |
+            MERGE (l:Language {iso_code: sl.iso_639_1, name: sl.name})
+            MERGE (m)-[:HAS_LANGUAGE]->(l)
+        )
+    } IN TRANSACTIONS OF $batch_size ROWS
+    RETURN count(*) as total
+"""
+
+# Cypher query loading nodes, relationships and their properties into the page cache with APOC
+_APOC_WARMUP_QUERY = "CALL apoc.warmup.run(true, true, true)"
+
+# Cypher query touching every node, relationship and the properties read by the find queries,
+# which pulls them into the page cache when APOC warmup is not available
+_WARMUP_QUERY = """
+    MATCH (n)
+    OPTIONAL MATCH (n)-[r]->()
+    RETURN count(n.title) + count(n.name) + count(r.character) as total
+"""
+
+
+def _freeze(value):
+    """
+    Converts query parameters into a hashable value, to be used as a cache key.
+    Args:
+        value: Parameter value, possibly a dict or a list.
+    Returns:
+        A hashable equivalent of the value.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 class Neo4jMoviesCatalog:
@@ -17,7 +333,11 @@ class Neo4jMoviesCatalog:
         uri: str, 
         user: str, 
         password: str, 
-        db_name: str
+        db_name: str,
+        pool_size: int = 50,
+        connection_acquisition_timeout: float = 60,
+        max_connection_lifetime: float = 3600,
+        fetch_size: int = 1000,
     ):
         """
         Initializes the Neo4jMoviesCatalog with connection parameters.
@@ -26,8 +346,13 @@ class Neo4jMoviesCatalog:
             user (str): Username for authentication.
             password (str): Password for authentication.
             db_name (str): Database name.
+            pool_size (int): Maximum number of connections kept in the driver pool.
+                Imports use one connection per writer thread, plus five for the movie relations.
+            connection_acquisition_timeout (float): Seconds to wait for a free connection.
+            max_connection_lifetime (float): Seconds after which pooled connections are recycled.
+            fetch_size (int): Number of records pulled per batch by read queries.
         Raises:
-            ValueError: If any parameter is empty.
+            ValueError: If any parameter is empty or pool_size is lower than 1.
         """
         if not uri or uri.strip() == "":
             raise ValueError("The 'uri' parameter must be a non-empty string.")
@@ -37,10 +362,32 @@ class Neo4jMoviesCatalog:
             raise ValueError("The 'password' parameter must be a non-empty string.")
         if not db_name or db_name.strip() == "":
             raise ValueError("The 'db_name' parameter must be a non-empty string.")
+        if pool_size < 1:
+            raise ValueError("The 'pool_size' parameter must be at least 1.")
 
-        self.__driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.__driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=pool_size,
+            connection_acquisition_timeout=connection_acquisition_timeout,
+            max_connection_lifetime=max_connection_lifetime,
+        )
         self.__driver.verify_connectivity()
         self.__db_name = db_name
+        self.__apoc_available = None
+
+        # Results of read queries, cleared by every write through this catalog
+        self.__read_cache = TTLCache(maxsize=_READ_CACHE_SIZE, ttl=_READ_CACHE_TTL)
+        self.__read_cache_lock = threading.Lock()
+        # Bumped on every clear, so reads overlapping a write do not cache their result
+        self.__read_cache_generation = 0
+
+        # Reads stream results in batches, writes only return a summary row so pull it all at once
+        self.__session_kwargs = {"database": db_name, "fetch_size": fetch_size}
+        self.__write_session_kwargs = {"database": db_name, "fetch_size": -1}
+
+        # Create the indexes once, before any import or query relies on them
+        self.ensure_schema()
 
     def close(self):
         """
@@ -66,25 +413,43 @@ class Neo4jMoviesCatalog:
     def _get_total_chunks(
         self, 
         csv_path: str, 
-        chunksize: int
+        chunksize: int,
+        limit: int | None = None,
     ) -> int:
         """
-        Calculates the total number of chunks required to process a CSV file in batches.
+        Estimates the total number of chunks required to process a CSV file in batches.
 
         Args:
             csv_path (str): The file path to the CSV file.
             chunksize (int): The number of rows per chunk.
+            limit (int | None): Max number of rows that will be processed.
 
         Returns:
-            int: The total number of chunks needed to process the file. Returns 0 if an error occurs.
+            int: The estimated number of chunks needed to process the file. Returns 0 if an error occurs.
 
         Notes:
             Assumes the first row of the CSV file is a header and excludes it from the row count.
+            Only the first 64 KiB are read: the row count is extrapolated from the file size and
+            the average row size of that sample, so the file is not scanned twice. Files smaller
+            than the sample are counted exactly.
         """
         try:
+            file_size = os.path.getsize(csv_path)
             with open(csv_path, "rb") as f:
-                total_rows = sum(1 for _ in f) - 1  # subtract header row
-            return math.ceil(total_rows / chunksize)
+                sample = f.read(_COUNT_SAMPLE_SIZE)
+            if not sample:
+                return 0
+
+            sample_rows = sample.count(b"\n")
+            if len(sample) >= file_size:
+                if not sample.endswith(b"\n"):
+                    sample_rows += 1  # last row without trailing newline
+                total_rows = sample_rows - 1  # subtract header row
+            else:
+                total_rows = round(file_size * max(sample_rows, 1) / len(sample)) - 1
+            if limit is not None:
+                total_rows = min(total_rows, limit)
+            return math.ceil(max(total_rows, 0) / chunksize)
         except Exception as e:
             print(f"Error occurred while getting total chunks: {e}")
             return 0
@@ -96,249 +461,574 @@ class Neo4jMoviesCatalog:
             bool: True if empty, False otherwise.
         """
         query = "MATCH (n) RETURN count(n) as total"
-        result = self.query(query)
+        result = self.query(query, use_cache=False)
         return result[0]["total"] == 0 if result else True
 
+    def warm_cache(self):
+        """
+        Loads the graph into the server's page cache, so the first queries do not read from disk.
+        Uses apoc.warmup.run when it is installed, and a query scanning every node and
+        relationship otherwise.
+        """
+        query = """
+            SHOW PROCEDURES YIELD name
+            WHERE name = 'apoc.warmup.run'
+            RETURN count(*) > 0 AS available
+        """
+        if self.query(query, use_cache=False)[0]["available"]:
+            self.query(_APOC_WARMUP_QUERY, use_cache=False)
+        else:
+            self.query(_WARMUP_QUERY, use_cache=False)
+
+    def ensure_schema(self):
+        """
+        Creates the constraints and indexes used by the import and find queries, if they
+        do not exist. Without them every MERGE falls back to a label scan.
+        Called once when the catalog is created.
+        """
+        for statement in _SCHEMA_STATEMENTS:
+            self._write(statement)
+
+    def backfill_search_properties(self, batch_size: int = 10_000) -> int:
+        """
+        Sets the lowercase search properties on Person, Genre, Keyword and Country nodes
+        that lack them, such as nodes of a database imported before they were stored.
+        Nodes that have them are left as is. Every node of these labels is scanned, so run
+        it once after upgrading such a database, not on every start.
+        Args:
+            batch_size (int): Number of nodes updated per transaction.
+        Returns:
+            int: Number of nodes updated.
+        """
+        total = 0
+        # CALL { ... } IN TRANSACTIONS commits on its own, so it needs an auto-commit transaction
+        with self.__driver.session(**self.__write_session_kwargs) as session:
+            for query in _BACKFILL_QUERIES:
+                total += session.run(query, {"batch_size": batch_size}).single()["total"]
+        self._clear_read_cache()
+        return total
+
     def populate_movies_from_csv(
         self,
         csv_path: str,
         limit: int | None = None,
-        chunk_size: int = 5000,
+        read_chunk_size: int = 50_000,
+        write_batch_size: int | None = None,
+        workers: int = 8,
     ) -> int:
         """
         Loads movies from a CSV file into the database in chunks.
+        Chunks are split into batches written concurrently by a pool of worker threads.
         Args:
             csv_path (str): Path to the movies CSV file.
             limit (int | None): Max number of rows to process.
-            chunk_size (int): Number of rows per chunk.
+            read_chunk_size (int): Number of rows read from the CSV file at once.
+            write_batch_size (int | None): Number of movies per write batch. Movies carry many
+                properties and nested lists, so batches default to 1000 movies to bound
+                transaction memory. When APOC is installed, it defaults to read_chunk_size,
+                as APOC splits each batch into bounded transactions on the server.
+            workers (int): Number of concurrent writer threads.
         Returns:
             int: Number of movies inserted.
         """
-        total_chunks = self._get_total_chunks(csv_path, chunk_size)
-        total_processed = 0
-        total_inserted = 0
-
-        reader = pd.read_csv(csv_path, chunksize=chunk_size)
-
-        for i, chunk in enumerate(reader):
-            print(f"Processing chunk {i + 1} out of {total_chunks} : {chunk.shape[0]} rows")
-
-            # Respect the limit if provided
-            if limit is not None:
-                remaining = limit - total_processed
-                if remaining <= 0:
-                    break
-                chunk = chunk.head(remaining)
+        if write_batch_size is None:
+            write_batch_size = read_chunk_size if self._is_apoc_available() else 1000
 
-            # Apply transformation pipeline
-            chunk = transform_movies(chunk)
-
-            # Insert into Neo4j
-            movies = chunk.to_dict(orient="records")
-            if movies:
-                result = self.add_movies(movies)
-                total_inserted += result[0]["total"]
-
-            total_processed += chunk.shape[0]
-
-        return total_inserted
+        # Movies MERGE on disjoint movie_id keys, so batches never conflict. Batches of different
+        # movies share their genres, keywords and countries though, so each related label gets a
+        # single writer thread for the whole ingest, serializing its writes across all workers.
+        with ExitStack() as stack:
+            submit_relations = {
+                column: stack.enter_context(self._session_executor(1)) for column in _MOVIE_RELATIONS
+            }
+            return self._ingest_chunks(
+                read_csv_chunks(csv_path, read_chunk_size, MOVIES_CSV_COLUMNS, limit),
+                total_chunks=self._get_total_chunks(csv_path, read_chunk_size, limit),
+                transform=lambda chunk: flatten_movies_columns(transform_movies_columns(chunk)),
+                write=lambda batch, session: self.add_movies(
+                    batch, session=session, submit_relations=submit_relations
+                ),
+                workers=workers,
+                batch_size=write_batch_size,
+            )
 
     def populate_credits_from_csv(
         self,
         csv_path: str,
         limit: int | None = None,
-        chunk_size: int = 5000,
+        read_chunk_size: int = 50_000,
+        write_batch_size: int = 500,
+        workers: int = 8,
     ) -> int:
         """
         Loads credits from a CSV file into the database in chunks.
+        Chunks are split into batches written concurrently by a pool of worker threads.
         Args:
             csv_path (str): Path to the credits CSV file.
             limit (int | None): Max number of rows to process.
-            chunk_size (int): Number of rows per chunk.
+            read_chunk_size (int): Number of rows read from the CSV file at once.
+            write_batch_size (int): Number of credit rows per write batch. Credit rows carry
+                whole cast and crew lists, so batches are kept small to bound transaction
+                memory and lock footprint.
+            workers (int): Number of concurrent writer threads. Forced to 1 when APOC is
+                installed, see below.
         Returns:
             int: Number of credits inserted.
         """
-        total_chunks = self._get_total_chunks(csv_path, chunk_size)
-        total_processed = 0
-        total_inserted = 0
+        # Credits of different batches share Movie and Person nodes. Without APOC, a deadlocked
+        # batch is retried as a whole by execute_write. APOC only retries its inner batches and
+        # then reports them as failed, which aborts the ingest, so its batches must not run concurrently.
+        if self._is_apoc_available():
+            workers = 1
 
-        reader = pd.read_csv(csv_path, chunksize=chunk_size)
+        return self._ingest_chunks(
+            read_csv_chunks(csv_path, read_chunk_size, CREDITS_CSV_COLUMNS, limit),
+            total_chunks=self._get_total_chunks(csv_path, read_chunk_size, limit),
+            transform=lambda chunk: flatten_credits_columns(transform_credits_columns(chunk)),
+            write=self.add_credits,
+            workers=workers,
+            batch_size=write_batch_size,
+        )
 
-        for i, chunk in enumerate(reader):
-            print(f"Processing chunk {i + 1} out of {total_chunks} : {chunk.shape[0]} rows")
+    def populate_movies_from_server_csv(
+        self,
+        filename: str,
+        batch_size: int = 5000,
+    ) -> int:
+        """
+        Loads movies from a CSV file that the Neo4j server reads itself with LOAD CSV,
+        so no rows travel through the driver. The file must be in the server's import
+        directory, and APOC must be installed to parse the JSON columns.
+        Use populate_movies_from_csv for files that are only available to this client.
+        Args:
+            filename (str): Path of the movies CSV file, relative to the server's import directory.
+            batch_size (int): Number of rows committed per transaction.
+        Returns:
+            int: Number of movies loaded.
+        Raises:
+            RuntimeError: If APOC is not installed.
+        """
+        if not self._is_apoc_available():
+            raise RuntimeError("Loading movies from a server CSV file requires the APOC plugin.")
 
-            # Respect the limit if provided
-            if limit is not None:
-                remaining = limit - total_processed
-                if remaining <= 0:
-                    break
-                chunk = chunk.head(remaining)
+        # CALL { ... } IN TRANSACTIONS commits on its own, so it needs an auto-commit transaction
+        with self.__driver.session(**self.__write_session_kwargs) as session:
+            result = session.run(
+                _LOAD_MOVIES_CSV_QUERY,
+                {"url": f"file:///{filename.lstrip('/')}", "batch_size": batch_size},
+            )
+            total = result.single()["total"]
+        self._clear_read_cache()
+        return total
 
-            # Apply transformation pipeline
-            chunk = transform_credits(chunk)
+    def _ingest_chunks(
+        self,
+        chunks: Iterator[dict[str, list]],
+        total_chunks: int,
+        transform: Callable[[dict[str, list]], dict[str, list]],
+        write: Callable[[dict[str, list], Session], int],
+        workers: int,
+        batch_size: int,
+    ) -> int:
+        """
+        Transforms chunks of rows and writes them to the database using a thread pool.
+        A producer thread reads the chunks ahead, while each worker thread of a
+        _session_executor transforms and writes its batches in the session it keeps for
+        the whole ingest, instead of paying the session setup for each write.
+        Args:
+            chunks (Iterator[dict[str, list]]): Chunks of rows read from a CSV file, as column lists.
+            total_chunks (int): Expected number of chunks, used for progress output.
+            transform (Callable): Transformation pipeline applied to each chunk.
+            write (Callable): Method inserting a dict of column lists in the given session,
+                returning the number inserted.
+            workers (int): Number of concurrent writer threads.
+            batch_size (int): Maximum number of rows per write batch.
+        Returns:
+            int: Number of records inserted.
+        Raises:
+            ValueError: If workers or batch_size is lower than 1.
+        """
+        if workers < 1:
+            raise ValueError("The 'workers' parameter must be at least 1.")
+        if batch_size < 1:
+            raise ValueError("The 'batch_size' parameter must be at least 1.")
+
+        # Read chunks on a producer thread, so that parsing the CSV overlaps with the
+        # writes. The queue holds two chunks ahead of the writers at most.
+        ready = queue.Queue(maxsize=2)
+        stop = threading.Event()
 
-            # Insert into Neo4j
-            credits = chunk.to_dict(orient="records")
-            if credits:
-                result = self.add_credits(credits)
-                total_inserted += result[0]["total"]
+        def produce():
+            try:
+                for i, chunk in enumerate(chunks):
+                    if stop.is_set():
+                        return
+                    num_rows = len(next(iter(chunk.values()), []))
+                    print(f"Processing chunk {i + 1} out of {total_chunks} : {num_rows} rows")
+                    ready.put(chunk)
+            except Exception as e:
+                ready.put(e)
+            finally:
+                ready.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        def write_batch(batch, session):
+            # Apply transformation pipeline on the worker. Parsing holds the GIL, so it does not
+            # scale with workers, it only overlaps with the other workers' waits on the database.
+            return write(transform(batch), session=session)
+
+        total_inserted = 0
+
+        try:
+            with self._session_executor(workers) as submit:
+                pending = set()
 
-            total_processed += chunk.shape[0]
+                while (chunk := ready.get()) is not None:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+
+                    # Insert into Neo4j as column lists, avoiding one dict per row
+                    num_rows = len(next(iter(chunk.values()), []))
+                    for start in range(0, num_rows, batch_size):
+                        batch = {
+                            name: values[start:start + batch_size]
+                            for name, values in chunk.items()
+                        }
+                        pending.add(submit(write_batch, batch))
+
+                        # Bound the number of batches held in memory while writers catch up
+                        if len(pending) >= 2 * workers:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            total_inserted += sum(f.result() for f in done)
+
+                for future in as_completed(pending):
+                    total_inserted += future.result()
+        finally:
+            # Unblock the producer if it is still waiting on a full queue
+            stop.set()
+            while producer.is_alive():
+                try:
+                    ready.get(timeout=0.1)
+                except queue.Empty:
+                    pass
 
         return total_inserted
 
-    def query(self, query, parameters=None):
+    @contextmanager
+    def _session_executor(self, max_workers: int) -> Iterator[Callable[..., Future]]:
         """
-        Executes a Cypher query against the database.
+        Runs write tasks on a thread pool whose threads each open one write session and
+        reuse it for every task, until the pool is closed.
+        Args:
+            max_workers (int): Number of threads, and so of sessions.
+        Yields:
+            Callable[..., Future]: Function submitting fn(*args, session=...) to the pool,
+                with the session of the thread running it, and returning its future.
+        """
+        local = threading.local()
+        sessions = []
+        sessions_lock = threading.Lock()
+
+        def open_session():
+            local.session = self._write_session()
+            with sessions_lock:
+                sessions.append(local.session)
+
+        def run(fn, args):
+            return fn(*args, session=local.session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, initializer=open_session) as executor:
+                yield lambda fn, *args: executor.submit(run, fn, args)
+        finally:
+            for session in sessions:
+                session.close()
+
+    def query(self, query, parameters=None, use_cache: bool = True):
+        """
+        Executes a read-only Cypher query against the database in a managed read transaction.
+        Results are cached per query and parameters for a short time, and the cache is
+        cleared by every write made through this catalog. A result is not cached if the
+        cache was cleared while it was read.
         Args:
             query (str): Cypher query string.
             parameters (dict, optional): Query parameters.
+            use_cache (bool): Whether to return a cached result and cache the new one.
         Returns:
             list[Record]: Query results.
         """
-        with self.__driver.session(database=self.__db_name) as session:
-            return list(session.run(query, parameters))
+        if use_cache:
+            key = (query, _freeze(parameters))
+            with self.__read_cache_lock:
+                cached = self.__read_cache.get(key)
+                generation = self.__read_cache_generation
+            if cached is not None:
+                return list(cached)
 
-    def add_movies(self, rows):
-        """
-        Adds movies to the database from a list of dictionaries.
-        Args:
-            rows (list[dict]): List of movie records.
-        Returns:
-            list[Record]: Query result with count of inserted movies.
-        """
-        query = """
-            UNWIND $rows AS row
-            MERGE (m:Movie {movie_id: row.id})
-              ON CREATE SET m.title = row.title,
-                            m.original_title = row.original_title,
-                            m.release_date = row.release_date,
-                            m.status = row.status,
-                            m.runtime = row.runtime,
-                            m.budget = row.budget,
-                            m.revenue = row.revenue,
-                            m.homepage = row.homepage,
-                            m.tagline = row.tagline,
-                            m.overview = row.overview,
-                            m.popularity = row.popularity,
-                            m.vote_average = row.vote_average,
-                            m.vote_count = row.vote_count
-        """
-        query += self._merge_genres()
-        query += self._merge_keywords()
-        query += self._merge_companies()
-        query += self._merge_countries()
-        query += self._merge_languages()
-        query += "RETURN count(*) as total"
-
-        return self.query(query, parameters={"rows": rows})
-
-    def _merge_genres(self):
-        """
-        Cypher fragment to merge genres and link them to movies.
-        """
-        return """
-            FOREACH (g IN row.genres |
-              MERGE (genre:Genre {name: g.name})
-              MERGE (m)-[:HAS_GENRE]->(genre)
-            )
-        """
+        with self.__driver.session(**self.__session_kwargs) as session:
+            result = session.execute_read(lambda tx: list(tx.run(query, parameters)))
 
-    def _merge_keywords(self):
-        """
-        Cypher fragment to merge keywords and link them to movies.
+        if use_cache:
+            with self.__read_cache_lock:
+                # A write committed during the read may not be visible in its result
+                if generation == self.__read_cache_generation:
+                    self.__read_cache[key] = result
+            return list(result)
+        return result
+
+    def _clear_read_cache(self):
         """
-        return """
-            FOREACH (k IN row.keywords |
-              MERGE (keyword:Keyword {name: k.name})
-              MERGE (m)-[:HAS_KEYWORD]->(keyword)
-            )
+        Discards all cached read query results.
         """
+        with self.__read_cache_lock:
+            self.__read_cache.clear()
+            self.__read_cache_generation += 1
 
-    def _merge_companies(self):
+    def _write_session(self) -> Session:
         """
-        Cypher fragment to merge production companies and link them to movies.
-        """
-        return """
-            FOREACH (c IN row.production_companies |
-              MERGE (pc:ProductionCompany {name: c.name})
-              MERGE (m)-[:PRODUCED_BY]->(pc)
-            )
+        Opens a session for write transactions, to be reused across several writes.
+        Returns:
+            Session: A new write session, to be closed by the caller.
         """
+        return self.__driver.session(**self.__write_session_kwargs)
 
-    def _merge_countries(self):
+    def _write(self, query, parameters=None, session: Session | None = None) -> Record | None:
         """
-        Cypher fragment to merge production countries and link them to movies.
-        """
-        return """
-            FOREACH (pc IN row.production_countries |
-              MERGE (c:Country {iso_code: pc.iso_3166_1, name: pc.name})
-              MERGE (m)-[:PRODUCED_IN]->(c)
-            )
+        Executes a Cypher write query in a managed write transaction.
+        The driver retries the transaction on transient errors such as deadlocks.
+        Write queries return at most one record, so no result list is built.
+        Args:
+            query (str): Cypher query string.
+            parameters (dict, optional): Query parameters.
+            session (Session, optional): Open write session to run the transaction in.
+                If not given, a session is opened for this query only.
+        Returns:
+            Record | None: The single result record, or None if the query returns no rows.
         """
+        try:
+            if session is not None:
+                return session.execute_write(lambda tx: tx.run(query, parameters).single())
+
+            with self._write_session() as session:
+                return session.execute_write(lambda tx: tx.run(query, parameters).single())
+        finally:
+            # Cached reads may no longer match the database once the write is committed
+            self._clear_read_cache()
 
-    def _merge_languages(self):
+    def _write_count(self, query, parameters=None, session: Session | None = None) -> int:
         """
-        Cypher fragment to merge spoken languages and link them to movies.
+        Executes a Cypher write query returning a single count, in a managed write transaction.
+        Args:
+            query (str): Cypher query string, returning one row with the count as first value.
+            parameters (dict, optional): Query parameters.
+            session (Session, optional): Open write session to run the transaction in.
+        Returns:
+            int: The returned count, or 0 if the query returns no rows.
         """
-        return """
-            FOREACH (sl IN row.spoken_languages |
-              MERGE (l:Language {iso_code: sl.iso_639_1, name: sl.name})
-              MERGE (m)-[:HAS_LANGUAGE]->(l)
-            )
+        record = self._write(query, parameters=parameters, session=session)
+        return record[0] if record is not None else 0
+
+    def add_movies(
+        self,
+        columns,
+        session: Session | None = None,
+        submit_relations: dict[str, Callable[..., Future]] | None = None,
+    ):
         """
+        Adds movies to the database from column lists.
+        Movies are merged first. Then the relationships to each related label are
+        written by _add_movie_relations, concurrently if a writer is given for each label.
+        When APOC is installed, every statement goes through apoc.periodic.iterate,
+        which splits the rows server-side into batches of bounded size.
+        Args:
+            columns (dict[str, list]): Movie columns processed by flatten_movies_columns.
+            session (Session, optional): Open write session to reuse for every transaction
+                run by this thread.
+            submit_relations (dict[str, Callable], optional): Submit function of a
+                _session_executor for each related column, writing the labels concurrently.
+                If not given, they are written in turn.
+        Returns:
+            int: Number of movies inserted.
+        Raises:
+            RuntimeError: If APOC reports failed batches.
+        """
+        # Only ship the scalar columns with the movie query, nested lists are sent per relation
+        total = self._write_columns(
+            _ADD_MOVIE_STATEMENT,
+            _ADD_MOVIES_QUERY,
+            {name: values for name, values in columns.items() if name not in _MOVIE_RELATIONS},
+            parallel=True,
+            session=session,
+        )
 
-    def add_credits(self, rows):
-        query = """
-            UNWIND $rows AS row
-            MATCH (m:Movie {movie_id: row.movie_id})
+        if submit_relations is None:
+            for column in _MOVIE_RELATIONS:
+                self._add_movie_relations(column, columns, session=session)
+            return total
+
+        # Related labels are independent, so their MERGE passes do not need to run in sequence
+        futures = [
+            submit(self._add_movie_relations, column, columns)
+            for column, submit in submit_relations.items()
+        ]
+        for future in futures:
+            future.result()
+
+        return total
+
+    def _add_movie_relations(
+        self,
+        column: str,
+        columns: dict[str, list],
+        session: Session | None = None,
+    ):
+        """
+        Links movies to the related nodes held in one of their flattened columns.
+        The distinct nodes of the chunk are merged once, then linked in a separate
+        UNWIND pass over the (movie, item) pairs, which keeps every transaction
+        short and avoids repeating the same MERGE for every occurrence of a node.
+        Args:
+            column (str): Movie column holding the related items, a key of _MOVIE_RELATIONS.
+            columns (dict[str, list]): Movie columns processed by flatten_movies_columns.
+            session (Session, optional): Open write session to run the transactions in.
+        Raises:
+            RuntimeError: If APOC reports failed batches.
         """
-        query += self._merge_cast()
-        query += self._merge_crew()
-        query += "RETURN count(*) as total"
+        merge_nodes_statement, link_statement = _MOVIE_RELATIONS[column]
+        merge_nodes_query, link_query = _MOVIE_RELATION_QUERIES[column]
+        rels = columns.get(column)
+        if not rels or not rels["movie_id"]:
+            return
 
-        return self.query(query, parameters={"rows": rows})
+        keys = [key for key in rels if key != "movie_id"]
+        nodes = set(zip(*(rels[key] for key in keys)))
+        self._write_columns(
+            merge_nodes_statement,
+            merge_nodes_query,
+            {key: list(values) for key, values in zip(keys, zip(*nodes))},
+            parallel=True,
+            session=session,
+        )
+        # Links of different movies share the related nodes, so parallel batches would deadlock
+        self._write_columns(link_statement, link_query, rels, parallel=False, session=session)
 
-    def _merge_cast(self):
+    def _write_columns(
+        self,
+        statement: str,
+        query: str,
+        columns: dict[str, list],
+        parallel: bool,
+        session: Session | None = None,
+    ) -> int:
         """
-        Cypher fragment to merge cast members and link them to movies.
+        Runs a Cypher statement over every row of column lists, indexed by i.
+        When APOC is installed, the statement is run by apoc.periodic.iterate in batches of
+        _APOC_MOVIES_BATCH_SIZE rows, each committed in its own transaction. Otherwise the
+        query, which unwinds the rows itself, runs in a single managed transaction.
+        Args:
+            statement (str): Cypher statement for the row at index i.
+            query (str): The statement prefixed with _UNWIND_COLUMNS and returning a count.
+            columns (dict[str, list]): Column names mapped to equally long lists of values.
+            parallel (bool): Whether APOC may run the batches concurrently.
+            session (Session, optional): Open write session to run the transaction in.
+        Returns:
+            int: Number of rows processed.
+        Raises:
+            RuntimeError: If APOC reports failed batches.
         """
-        return """
-            FOREACH (c IN row.cast |
-                MERGE (pc:Person {person_id: c.id})
-                ON CREATE SET pc.name = c.name, 
-                            pc.gender = c.gender
-                MERGE (pc)-[r:ACTED_IN]->(m)
-                SET r.character = c.character
+        parameters = {**columns, "size": len(next(iter(columns.values()), []))}
+        if not self._is_apoc_available():
+            return self._write_count(query, parameters=parameters, session=session)
+
+        result = self._write(
+            _APOC_ITERATE_COLUMNS_QUERY,
+            parameters={
+                "statement": statement,
+                "columns": parameters,
+                "batch_size": _APOC_MOVIES_BATCH_SIZE,
+                "parallel": parallel,
+            },
+            session=session,
+        )
+        if result["failedOperations"] > 0:
+            raise RuntimeError(
+                f"Failed to import {result['failedOperations']} rows: {result['errorMessages']}"
             )
+        return result["total"]
+
+    def _is_apoc_available(self) -> bool:
         """
+        Checks once whether the apoc.periodic.iterate procedure is installed on the server.
+        Returns:
+            bool: True if the procedure can be called, False otherwise.
+        """
+        if self.__apoc_available is None:
+            query = """
+                SHOW PROCEDURES YIELD name
+                WHERE name = 'apoc.periodic.iterate'
+                RETURN count(*) > 0 AS available
+            """
+            try:
+                self.__apoc_available = self.query(query)[0]["available"]
+            except Exception:
+                self.__apoc_available = False
+        return self.__apoc_available
 
-    def _merge_crew(self):
+    def add_credits(self, columns, session: Session | None = None):
         """
-        Cypher fragment to merge crew members and link them to movies.
+        Adds cast and crew credits to existing movies from column lists.
+        The credit rows of actors, directors and other contributors, flattened by
+        flatten_credits_columns, are merged with one UNWIND query per kind. When APOC
+        is installed, the rows are handed to apoc.periodic.iterate, which merges them
+        server-side in sequential batches of bounded size instead of one large transaction.
+        Args:
+            columns (dict[str, list]): Credit columns processed by flatten_credits_columns.
+            session (Session, optional): Open write session to reuse for every transaction.
+        Returns:
+            int: Number of credits processed.
+        Raises:
+            RuntimeError: If APOC reports failed batches.
         """
-        return """
-            FOREACH (cr IN row.crew |
-                MERGE (pr:Person {person_id: cr.id})
-                ON CREATE SET pr.name = cr.name, 
-                            pr.gender = cr.gender
-                FOREACH (_ IN CASE WHEN toLower(cr.job) = 'director' THEN [1] ELSE [] END |
-                    MERGE (pr)-[:DIRECTED]->(m)
-                )
-                FOREACH (_ IN CASE WHEN toLower(cr.job) <> 'director' THEN [1] ELSE [] END |
-                    MERGE (pr)-[r:CONTRIBUTED_TO]->(m)
-                    SET r.job = cr.job,
-                        r.department = cr.department,
-                        r.credit_id = cr.credit_id
-                )
+        credits = {kind: columns.get(kind) or [] for kind in _CREDIT_STATEMENTS}
+
+        use_apoc = self._is_apoc_available()
+        for kind, rows in credits.items():
+            if not rows:
+                continue
+            if not use_apoc:
+                self._write(_CREDIT_QUERIES[kind], parameters={"rows": rows}, session=session)
+                continue
+
+            result = self._write(
+                _APOC_ITERATE_QUERY,
+                parameters={
+                    "statement": _CREDIT_STATEMENTS[kind],
+                    "rows": rows,
+                    "batch_size": _APOC_CREDITS_BATCH_SIZE,
+                },
+                session=session,
             )
-        """
+            if result["failedOperations"] > 0:
+                raise RuntimeError(
+                    f"Failed to import {result['failedOperations']} {kind} credits: {result['errorMessages']}"
+                )
+
+        # Count on the writer, so the result does not depend on a replica catching up
+        return self._write_count(
+            _COUNT_CREDITS_QUERY,
+            parameters={"movie_id": columns["movie_id"]},
+            session=session,
+        )
 
     def find_movies_by_director(
         self, director_name: str, limit: int = 10
     ) -> list[Record]:
         """
         Finds movies directed by a given director.
+        The name is matched case-insensitively as a substring of the stored
+        lowercase name, using its text index.
         Args:
             director_name (str): Director's name.
             limit (int): Maximum number of movies to return.
@@ -346,8 +1036,9 @@ class Neo4jMoviesCatalog:
             list[Record]: List of matching movies.
         """
         query = """
-            MATCH (p:Person)-[:DIRECTED]->(m:Movie)
-            WHERE toLower(p.name) CONTAINS toLower($director_name)
+            MATCH (p:Person)
+            WHERE p.name_lc CONTAINS $director_name_lc
+            MATCH (p)-[:DIRECTED]->(m:Movie)
             RETURN m.movie_id AS movie_id, 
                 m.title AS title, 
                 p.name AS director, 
@@ -356,7 +1047,11 @@ class Neo4jMoviesCatalog:
             LIMIT $limit
         """
         return self.query(
-            query, parameters={"director_name": director_name, "limit": limit}
+            query,
+            parameters={
+                "director_name_lc": director_name.lower(),
+                "limit": limit,
+            },
         )
 
     def find_movies_by_actors(
@@ -372,9 +1067,9 @@ class Neo4jMoviesCatalog:
         """
         query = """
             MATCH (m:Movie)<-[:ACTED_IN]-(p:Person)
-            WHERE toLower(p.name) IN [name IN $actor_names | toLower(name)]
-            WITH m, collect(DISTINCT toLower(p.name)) AS matched_actors
-            WHERE ALL(name IN [n IN $actor_names | toLower(n)] WHERE name IN matched_actors)
+            WHERE p.name_lc IN $actor_names_lc
+            WITH m, collect(DISTINCT p.name_lc) AS matched_actors
+            WHERE ALL(name IN $actor_names_lc WHERE name IN matched_actors)
             RETURN m.movie_id AS movie_id, 
                 m.title AS title, 
                 m.release_date AS release_date, 
@@ -383,7 +1078,11 @@ class Neo4jMoviesCatalog:
             LIMIT $limit
         """
         return self.query(
-            query, parameters={"actor_names": actor_names, "limit": limit}
+            query,
+            parameters={
+                "actor_names_lc": [name.lower() for name in actor_names],
+                "limit": limit,
+            },
         )
 
     def find_movies_by_genre(
@@ -391,6 +1090,8 @@ class Neo4jMoviesCatalog:
     ) -> list[Record]:
         """
         Finds movies by genre, optionally after a given year.
+        The genre is matched case-insensitively as a substring of the stored
+        lowercase name, using its text index.
         Args:
             genre_name (str): Genre name.
             after_year (int | None): Year filter.
@@ -399,9 +1100,10 @@ class Neo4jMoviesCatalog:
             list[Record]: List of matching movies.
         """
         query = """
-            MATCH (g:Genre)<-[:HAS_GENRE]-(m:Movie)
-            WHERE toLower(g.name) CONTAINS toLower($genre_name)
-            AND ($after_year IS NULL OR m.release_date.year > $after_year)
+            MATCH (g:Genre)
+            WHERE g.name_lc CONTAINS $genre_name_lc
+            MATCH (g)<-[:HAS_GENRE]-(m:Movie)
+            WHERE $after_year IS NULL OR m.release_date.year > $after_year
             RETURN m.movie_id AS movie_id, 
                 m.title AS title, 
                 m.release_date AS release_date,
@@ -412,7 +1114,7 @@ class Neo4jMoviesCatalog:
         return self.query(
             query,
             parameters={
-                "genre_name": genre_name,
+                "genre_name_lc": genre_name.lower(),
                 "after_year": after_year,
                 "limit": limit,
             },
@@ -423,6 +1125,8 @@ class Neo4jMoviesCatalog:
     ) -> list[Record]:
         """
         Finds movies by keywords.
+        Each keyword is matched case-insensitively as a substring of the stored
+        lowercase keywords, using their text index.
         Args:
             keywords (list[str]): List of keywords.
             limit (int): Maximum number of movies to return.
@@ -430,8 +1134,11 @@ class Neo4jMoviesCatalog:
             list[Record]: List of matching movies.
         """
         query = """
-            MATCH (m:Movie)-[:HAS_KEYWORD]->(k:Keyword)
-            WHERE any(keyword IN $keywords WHERE toLower(k.name) CONTAINS toLower(keyword))
+            UNWIND $keywords_lc AS keyword
+            MATCH (k:Keyword)
+            WHERE k.name_lc CONTAINS keyword
+            WITH DISTINCT k
+            MATCH (m:Movie)-[:HAS_KEYWORD]->(k)
             RETURN m.movie_id AS movie_id, 
                 m.title AS title, 
                 m.release_date AS release_date,
@@ -439,7 +1146,16 @@ class Neo4jMoviesCatalog:
             ORDER BY m.release_date DESC
             LIMIT $limit
         """
-        return self.query(query, parameters={"keywords": keywords, "limit": limit})
+        if not keywords:
+            return []
+
+        return self.query(
+            query,
+            parameters={
+                "keywords_lc": [keyword.lower() for keyword in keywords],
+                "limit": limit,
+            },
+        )
 
     def find_movies_produced_in_country(
         self, country_iso_code: str, limit: int = 10
@@ -453,8 +1169,7 @@ class Neo4jMoviesCatalog:
             list[Record]: List of matching movies.
         """
         query = """
-            MATCH (c:Country)<-[:PRODUCED_IN]-(m:Movie)
-            WHERE toLower(c.iso_code) = toLower($country_iso_code)
+            MATCH (c:Country {iso_code_lc: $country_iso_code_lc})<-[:PRODUCED_IN]-(m:Movie)
             RETURN m.movie_id AS movie_id, 
                 m.title AS title, 
                 c.name AS country, m.release_date AS release_date
@@ -462,7 +1177,11 @@ class Neo4jMoviesCatalog:
             LIMIT $limit
         """
         return self.query(
-            query, parameters={"country_iso_code": country_iso_code, "limit": limit}
+            query,
+            parameters={
+                "country_iso_code_lc": country_iso_code.lower(),
+                "limit": limit,
+            },
         )
 
     def find_most_popular_movies(self, limit: int = 10) -> list[Record]:
@@ -553,14 +1272,29 @@ class Neo4jMoviesCatalog:
         Returns:
             bool: True if successful, False otherwise.
         """
+        return self.link_actors_to_movies([(actor_name, movie_title)])
+
+    def link_actors_to_movies(self, pairs: list[tuple[str, str]]) -> bool:
+        """
+        Links actors to movies by creating ACTED_IN relationships, in a single query.
+        Args:
+            pairs (list[tuple[str, str]]): Actor names and the titles of the movies to link them to.
+        Returns:
+            bool: True if successful, False otherwise.
+        """
         query = """
-            MATCH (a:Person {name: $actor_name})
-            MATCH (m:Movie {title: $movie_title})
+            UNWIND range(0, size($actor_name) - 1) AS i
+            MATCH (a:Person {name: $actor_name[i]})
+            MATCH (m:Movie {title: $movie_title[i]})
             MERGE (a)-[:ACTED_IN]->(m)
         """
         try:
-            self.query(
-                query, parameters={"actor_name": actor_name, "movie_title": movie_title}
+            self._write(
+                query,
+                parameters={
+                    "actor_name": [actor_name for actor_name, _ in pairs],
+                    "movie_title": [movie_title for _, movie_title in pairs],
+                },
             )
             return True
         except Exception:
@@ -575,13 +1309,28 @@ class Neo4jMoviesCatalog:
         Returns:
             bool: True if successful, False otherwise.
         """
+        return self.unlink_actors_from_movies([(actor_name, movie_title)])
+
+    def unlink_actors_from_movies(self, pairs: list[tuple[str, str]]) -> bool:
+        """
+        Removes the ACTED_IN relationships between actors and movies, in a single query.
+        Args:
+            pairs (list[tuple[str, str]]): Actor names and the titles of the movies to unlink them from.
+        Returns:
+            bool: True if successful, False otherwise.
+        """
         query = """
-            MATCH (a:Person {name: $actor_name})-[r:ACTED_IN]->(m:Movie {title: $movie_title})
+            UNWIND range(0, size($actor_name) - 1) AS i
+            MATCH (a:Person {name: $actor_name[i]})-[r:ACTED_IN]->(m:Movie {title: $movie_title[i]})
             DELETE r
         """
         try:
-            self.query(
-                query, parameters={"actor_name": actor_name, "movie_title": movie_title}
+            self._write(
+                query,
+                parameters={
+                    "actor_name": [actor_name for actor_name, _ in pairs],
+                    "movie_title": [movie_title for _, movie_title in pairs],
+                },
             )
             return True
         except Exception:
@@ -20,13 +20,16 @@ def main():
             # If catalog is empty, populate it with movies from CSV dataset
             if catalog.is_empty():
                 print(f"Populating catalog with movies from CSV file: {movies_csv_path} ...")
-                movies_count = catalog.populate_movies_from_csv(movies_csv_path, chunk_size=200)
+                movies_count = catalog.populate_movies_from_csv(movies_csv_path)
                 print(f"Catalog populated with {movies_count} movies.")
 
                 print(f"Populating catalog with credits from CSV file: {credits_csv_path} ...")
-                credits_count = catalog.populate_credits_from_csv(credits_csv_path, chunk_size=200)
+                credits_count = catalog.populate_credits_from_csv(credits_csv_path)
                 print(f"Catalog populated with {credits_count} credits.")
 
+            # Load the graph into memory before running the queries
+            catalog.warm_cache()
+
             print("Catalog setup complete.\n")
 
             # Find movies by a specific director
@@ -0,0 +1,295 @@
+import csv
+import math
+import os
+import subprocess
+import tempfile
+from collections.abc import Iterable
+from contextlib import ExitStack
+from datetime import datetime
+from app.pipelines.read_csv import CREDITS_CSV_COLUMNS, MOVIES_CSV_COLUMNS, read_csv_chunks
+from app.pipelines.transform_credits import transform_credits_columns
+from app.pipelines.transform_movies import transform_movies_columns
+
+
+# Number of CSV rows read and transformed at once while writing the import files
+_READ_CHUNK_SIZE = 10_000
+
+# Movie properties and their neo4j-admin header types
+_MOVIE_PROPERTIES = {
+    "title": "",
+    "original_title": "",
+    "release_date": ":localdatetime",
+    "status": "",
+    "runtime": ":double",
+    "budget": ":long",
+    "revenue": ":long",
+    "homepage": "",
+    "tagline": "",
+    "overview": "",
+    "popularity": ":double",
+    "vote_average": ":double",
+    "vote_count": ":long",
+}
+
+# Related nodes of a movie, keyed by movie column: node label, relationship type, and the
+# item fields identifying a node mapped to node property names
+_MOVIE_RELATIONS = {
+    "genres": ("Genre", "HAS_GENRE", {"name": "name"}),
+    "keywords": ("Keyword", "HAS_KEYWORD", {"name": "name"}),
+    "production_companies": ("ProductionCompany", "PRODUCED_BY", {"name": "name"}),
+    "production_countries": ("Country", "PRODUCED_IN", {"iso_3166_1": "iso_code", "name": "name"}),
+    "spoken_languages": ("Language", "HAS_LANGUAGE", {"iso_639_1": "iso_code", "name": "name"}),
+}
+
+# Lowercase copies of searched properties stored by the online import, by node label
+_LOWERCASE_PROPERTIES = {
+    "Person": {"name": "name_lc"},
+    "Genre": {"name": "name_lc"},
+    "Keyword": {"name": "name_lc"},
+    "Country": {"iso_code": "iso_code_lc"},
+}
+
+
+def _csv_value(value) -> str:
+    """
+    Formats a value for a neo4j-admin import CSV file.
+    Missing values are written as empty fields, which neo4j-admin skips.
+    Args:
+        value: Value to format.
+    Returns:
+        str: Formatted value.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _lowercase_properties(label: str, properties: dict) -> dict:
+    """
+    Returns the given node properties with the lowercase copies for the label added.
+    Args:
+        label (str): Node label.
+        properties (dict): Node properties.
+    Returns:
+        dict: Properties including the lowercase copies.
+    """
+    lowercase = {
+        target: properties[source].lower() if isinstance(properties[source], str) else None
+        for source, target in _LOWERCASE_PROPERTIES.get(label, {}).items()
+    }
+    return {**properties, **lowercase}
+
+
+def write_admin_import_files(
+    movie_chunks: Iterable[dict[str, list]],
+    credit_chunks: Iterable[dict[str, list]],
+    output_dir: str,
+) -> dict:
+    """
+    Writes transformed movies and credits as node and relationship CSV files for
+    `neo4j-admin database import full --id-type=integer`.
+    Produces the same graph as the online import: related nodes and relationships are
+    deduplicated like MERGE would, and credits of unknown movies are skipped.
+    Args:
+        movie_chunks (Iterable[dict[str, list]]): Movie column lists processed by transform_movies_columns.
+        credit_chunks (Iterable[dict[str, list]]): Credit column lists processed by transform_credits_columns.
+        output_dir (str): Directory where the CSV files are written.
+    Returns:
+        dict: Paths of the files under 'nodes' and 'relationships', and the number of
+            imported rows under 'movies' and 'credits'.
+    """
+    nodes_files = []
+    relationships_files = []
+
+    def open_writer(stack: ExitStack, name: str, header: list[str], files: list[str]):
+        path = os.path.join(output_dir, f"{name}.csv")
+        files.append(path)
+        writer = csv.writer(stack.enter_context(open(path, "w", newline="", encoding="utf-8")))
+        writer.writerow(header)
+        return writer
+
+    # Movies and their related nodes
+    movie_ids = set()
+    related_nodes = {column: {} for column in _MOVIE_RELATIONS}
+
+    with ExitStack() as stack:
+        movies_writer = open_writer(
+            stack,
+            "movies",
+            ["movie_id:ID(Movie)"]
+            + [f"{name}{type_}" for name, type_ in _MOVIE_PROPERTIES.items()]
+            + [":LABEL"],
+            nodes_files,
+        )
+        relation_writers = {
+            column: open_writer(
+                stack,
+                rel_type.lower(),
+                [":START_ID(Movie)", f":END_ID({label})", ":TYPE"],
+                relationships_files,
+            )
+            for column, (label, rel_type, _) in _MOVIE_RELATIONS.items()
+        }
+
+        for chunk in movie_chunks:
+            for movie in (dict(zip(chunk, row)) for row in zip(*chunk.values())):
+                if movie["id"] in movie_ids:
+                    continue
+                movie_ids.add(movie["id"])
+                movies_writer.writerow(
+                    [movie["id"]]
+                    + [_csv_value(movie.get(name)) for name in _MOVIE_PROPERTIES]
+                    + ["Movie"]
+                )
+
+                for column, (_, rel_type, fields) in _MOVIE_RELATIONS.items():
+                    node_ids = related_nodes[column]
+                    linked = set()
+                    for item in movie.get(column) or []:
+                        key = tuple(item.get(field) for field in fields)
+                        node_id = node_ids.setdefault(key, len(node_ids))
+                        if node_id not in linked:
+                            linked.add(node_id)
+                            relation_writers[column].writerow([movie["id"], node_id, rel_type])
+
+    with ExitStack() as stack:
+        for column, (label, _, fields) in _MOVIE_RELATIONS.items():
+            properties = list(_lowercase_properties(label, dict.fromkeys(fields.values(), "")))
+            writer = open_writer(
+                stack,
+                label.lower(),
+                [f":ID({label})"] + properties + [":LABEL"],
+                nodes_files,
+            )
+            for key, node_id in related_nodes[column].items():
+                node = _lowercase_properties(label, dict(zip(fields.values(), key)))
+                writer.writerow([node_id] + [_csv_value(node[name]) for name in properties] + [label])
+
+    # Credits, keeping the first name and gender of a person and the last properties of a
+    # relationship, as ON CREATE SET and SET do in the online import
+    total_credits = 0
+    persons = {}
+    acted_in = {}
+    directed = set()
+    contributed_to = {}
+
+    for chunk in credit_chunks:
+        for credit in (dict(zip(chunk, row)) for row in zip(*chunk.values())):
+            movie_id = credit["movie_id"]
+            if movie_id not in movie_ids:
+                continue
+            total_credits += 1
+
+            for member in credit.get("cast") or []:
+                persons.setdefault(member["id"], member)
+                acted_in[(member["id"], movie_id)] = member.get("character")
+
+            for member in credit.get("crew") or []:
+                persons.setdefault(member["id"], member)
+                if str(member.get("job")).lower() == "director":
+                    directed.add((member["id"], movie_id))
+                else:
+                    contributed_to[(member["id"], movie_id)] = (
+                        member.get("job"),
+                        member.get("department"),
+                        member.get("credit_id"),
+                    )
+
+    with ExitStack() as stack:
+        writer = open_writer(
+            stack,
+            "persons",
+            ["person_id:ID(Person)", "name", "name_lc", "gender:long", ":LABEL"],
+            nodes_files,
+        )
+        for person_id, member in persons.items():
+            person = _lowercase_properties("Person", {"name": member.get("name")})
+            writer.writerow(
+                [person_id]
+                + [_csv_value(person["name"]), _csv_value(person["name_lc"])]
+                + [_csv_value(member.get("gender")), "Person"]
+            )
+
+        writer = open_writer(
+            stack,
+            "acted_in",
+            [":START_ID(Person)", ":END_ID(Movie)", "character", ":TYPE"],
+            relationships_files,
+        )
+        for (person_id, movie_id), character in acted_in.items():
+            writer.writerow([person_id, movie_id, _csv_value(character), "ACTED_IN"])
+
+        writer = open_writer(
+            stack,
+            "directed",
+            [":START_ID(Person)", ":END_ID(Movie)", ":TYPE"],
+            relationships_files,
+        )
+        for person_id, movie_id in directed:
+            writer.writerow([person_id, movie_id, "DIRECTED"])
+
+        writer = open_writer(
+            stack,
+            "contributed_to",
+            [":START_ID(Person)", ":END_ID(Movie)", "job", "department", "credit_id", ":TYPE"],
+            relationships_files,
+        )
+        for (person_id, movie_id), properties in contributed_to.items():
+            writer.writerow(
+                [person_id, movie_id] + [_csv_value(value) for value in properties] + ["CONTRIBUTED_TO"]
+            )
+
+    return {
+        "nodes": nodes_files,
+        "relationships": relationships_files,
+        "movies": len(movie_ids),
+        "credits": total_credits,
+    }
+
+
+def run_admin_import(
+    movies_csv_path: str,
+    credits_csv_path: str,
+    db_name: str,
+    neo4j_admin: str = "neo4j-admin",
+    overwrite: bool = False,
+) -> tuple[int, int]:
+    """
+    Loads movies and credits from CSV files with the offline neo4j-admin bulk importer.
+    Node and relationship files are written to a temporary directory, then loaded with
+    `neo4j-admin database import full`. This does not connect to Neo4j: it must run on the
+    database host, with the target database stopped (`STOP DATABASE <name>`, or the
+    server stopped for the default database), and the database started again afterwards.
+    Args:
+        movies_csv_path (str): Path to the movies CSV file.
+        credits_csv_path (str): Path to the credits CSV file.
+        db_name (str): Name of the database to create.
+        neo4j_admin (str): Path to the neo4j-admin executable.
+        overwrite (bool): Whether to replace an existing database and all its data.
+    Returns:
+        tuple[int, int]: Number of movies and number of credits imported.
+    Raises:
+        OSError: If neo4j-admin cannot be run.
+        subprocess.CalledProcessError: If the import fails.
+    """
+    with tempfile.TemporaryDirectory() as import_dir:
+        result = write_admin_import_files(
+            (transform_movies_columns(chunk) for chunk in
+             read_csv_chunks(movies_csv_path, _READ_CHUNK_SIZE, MOVIES_CSV_COLUMNS)),
+            (transform_credits_columns(chunk) for chunk in
+             read_csv_chunks(credits_csv_path, _READ_CHUNK_SIZE, CREDITS_CSV_COLUMNS)),
+            import_dir,
+        )
+        command = [
+            neo4j_admin, "database", "import", "full",
+            "--id-type=integer",
+            "--multiline-fields=true",
+            f"--overwrite-destination={str(overwrite).lower()}",
+            *(f"--nodes={path}" for path in result["nodes"]),
+            *(f"--relationships={path}" for path in result["relationships"]),
+            db_name,
+        ]
+        subprocess.run(command, check=True)
+    return result["movies"], result["credits"]
@@ -0,0 +1,96 @@
+from collections.abc import Iterator
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+
+# Block size used by the PyArrow CSV reader
+_CSV_BLOCK_SIZE = 16 << 20
+
+# Columns read from the movies CSV file and their types
+MOVIES_CSV_COLUMNS = {
+    "id": pa.int64(),
+    "title": pa.string(),
+    "original_title": pa.string(),
+    "release_date": pa.string(),
+    "status": pa.string(),
+    "runtime": pa.float64(),
+    "budget": pa.int64(),
+    "revenue": pa.int64(),
+    "homepage": pa.string(),
+    "tagline": pa.string(),
+    "overview": pa.string(),
+    "popularity": pa.float64(),
+    "vote_average": pa.float64(),
+    "vote_count": pa.int64(),
+    "genres": pa.string(),
+    "keywords": pa.string(),
+    "production_companies": pa.string(),
+    "production_countries": pa.string(),
+    "spoken_languages": pa.string(),
+}
+
+# Columns read from the credits CSV file and their types
+CREDITS_CSV_COLUMNS = {
+    "movie_id": pa.int64(),
+    "cast": pa.string(),
+    "crew": pa.string(),
+}
+
+
+def read_csv_chunks(
+    csv_path: str,
+    chunk_size: int,
+    column_types: dict[str, pa.DataType],
+    limit: int | None = None,
+) -> Iterator[dict[str, list]]:
+    """
+    Streams a CSV file as chunks of chunk_size rows using the PyArrow batched reader.
+
+    Args:
+        csv_path (str): The file path to the CSV file.
+        chunk_size (int): The number of rows per chunk.
+        column_types (dict[str, pa.DataType]): Columns to read and their Arrow types.
+        limit (int | None): Max number of rows to read. Reading stops as soon as it is reached.
+
+    Yields:
+        dict[str, list]: The next chunk of rows as the requested column names mapped
+            to lists of values, with missing values as None.
+
+    Notes:
+        Arrow parses blocks in parallel threads into typed columns, and converts them
+        straight to Python lists, without going through a pandas DataFrame. Column types
+        are fixed up front because the streaming reader infers them from the first block only.
+        Empty strings are read as None, as pandas reads them as NaN, so they are not parsed.
+    """
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=_CSV_BLOCK_SIZE, use_threads=True),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=list(column_types),
+            column_types=column_types,
+            strings_can_be_null=True,
+        ),
+    )
+
+    remaining = limit
+    pending = None
+    for batch in reader:
+        if remaining is not None:
+            if remaining <= 0:
+                break
+            batch = batch.slice(0, remaining)
+            remaining -= batch.num_rows
+
+        table = pa.Table.from_batches([batch])
+        if pending is not None:
+            table = pa.concat_tables([pending, table])
+
+        # Arrow blocks are sized in bytes, re-slice them into chunks of chunk_size rows
+        while table.num_rows >= chunk_size:
+            yield table.slice(0, chunk_size).to_pydict()
+            table = table.slice(chunk_size)
+        pending = table
+
+    if pending is not None and pending.num_rows > 0:
+        yield pending.to_pydict()
@@ -1,37 +1,88 @@
-import pandas as pd
 from app.utils.parse_helpers import parse_json
 
 
-def _transform_json_columns(chunk: pd.DataFrame) -> pd.DataFrame:
+# Columns holding JSON strings
+_JSON_COLUMNS = [
+    "cast",
+    "crew"
+]
+
+
+def _parse_json_values(values) -> list:
     """
-    Parses JSON columns ('cast', 'crew') in the given DataFrame chunk using parse_json.
+    Parses an iterable of raw values with parse_json.
+    Each distinct non-empty string of the chunk is parsed once, then the values are mapped
+    to the results. Cast and crew lists are unique per movie, so nothing is kept across chunks.
     Args:
-        chunk (pd.DataFrame): DataFrame containing columns to transform.
+        values: Raw column values, strings or missing values.
     Returns:
-        pd.DataFrame: DataFrame with parsed JSON columns.
+        list: Parsed values, None for missing or invalid ones.
     """
-    json_columns = [
-        "cast",
-        "crew"
-    ]
+    parsed = {value: parse_json(value) for value in set(values) if isinstance(value, str) and value}
+    return [parsed.get(value) for value in values]
 
-    for col in json_columns:
-        if col in chunk.columns:
-            chunk[col] = chunk[col].apply(parse_json)
-    return chunk
+
+def _transform_json_lists(columns: dict[str, list]) -> dict[str, list]:
+    """
+    Parses JSON column lists ('cast', 'crew') using parse_json.
+    Args:
+        columns (dict[str, list]): Column names mapped to lists of values.
+    Returns:
+        dict[str, list]: Columns with parsed JSON lists.
+    """
+    for col in _JSON_COLUMNS:
+        if col in columns:
+            columns[col] = _parse_json_values(columns[col])
+    return columns
 
 
-def transform_credits(chunk: pd.DataFrame) -> pd.DataFrame:
+def transform_credits_columns(columns: dict[str, list]) -> dict[str, list]:
     """
-    Applies a series of transformations to the credits DataFrame chunk.
-    Currently transforms JSON columns using helper functions.
+    Applies the credits transformations to a chunk held as column lists, without building a DataFrame.
     Args:
-        chunk (pd.DataFrame): DataFrame to transform.
+        columns (dict[str, list]): Column names mapped to lists of values.
     Returns:
-        pd.DataFrame: Transformed DataFrame.
+        dict[str, list]: Transformed columns.
     """
     for func in [
-        _transform_json_columns
+        _transform_json_lists
     ]:
-        chunk = func(chunk)
-    return chunk
+        columns = func(columns)
+    return columns
+
+
+def flatten_credits_columns(columns: dict[str, list]) -> dict[str, list]:
+    """
+    Flattens the parsed cast and crew lists into one row per person credit, split into
+    'cast', 'directors' and 'contributors' row lists ready to be sent to Neo4j.
+    The 'crew' column is dropped, and the 'movie_id' column is kept as is.
+    Args:
+        columns (dict[str, list]): Credit columns processed by transform_credits_columns.
+    Returns:
+        dict[str, list]: Columns with the flattened credit rows.
+    """
+    credits = {"cast": [], "directors": [], "contributors": []}
+    for movie_id, cast, crew in zip(columns["movie_id"], columns["cast"], columns["crew"]):
+        for member in cast or []:
+            credits["cast"].append({
+                "movie_id": movie_id,
+                "person_id": member.get("id"),
+                "name": member.get("name"),
+                "gender": member.get("gender"),
+                "character": member.get("character"),
+            })
+        for member in crew or []:
+            kind = "directors" if (member.get("job") or "").lower() == "director" else "contributors"
+            credits[kind].append({
+                "movie_id": movie_id,
+                "person_id": member.get("id"),
+                "name": member.get("name"),
+                "gender": member.get("gender"),
+                "job": member.get("job"),
+                "department": member.get("department"),
+                "credit_id": member.get("credit_id"),
+            })
+
+    columns.pop("crew")
+    columns.update(credits)
+    return columns
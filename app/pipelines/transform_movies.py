@@ -1,53 +1,148 @@
-import pandas as pd
+from datetime import datetime
+from functools import lru_cache
 from app.utils.parse_helpers import parse_date, parse_dict
 
 
-def _transform_dict_columns(chunk: pd.DataFrame) -> pd.DataFrame:
+# Columns holding string representations of lists of dictionaries
+_DICT_COLUMNS = [
+    "genres",
+    "keywords",
+    "production_companies",
+    "production_countries",
+    "spoken_languages",
+]
+
+# Item properties kept when flattening each dictionary column into relationship lists
+_RELATION_KEYS = {
+    "genres": ("name",),
+    "keywords": ("name",),
+    "production_companies": ("name",),
+    "production_countries": ("iso_3166_1", "name"),
+    "spoken_languages": ("iso_639_1", "name"),
+}
+
+# Maximum number of distinct raw values whose parsed result is memoized
+_PARSE_CACHE_SIZE = 200_000
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_dict_cached(value: str) -> dict | None:
+    """
+    Parses a string with parse_dict, memoized on the raw string.
+    The same genre, keyword or company lists repeat across many movies, so each distinct
+    string is parsed once. The returned object is shared and must not be modified.
+    Args:
+        value (str): String to parse.
+    Returns:
+        dict | None: Parsed dictionary or None if invalid.
+    """
+    return parse_dict(value)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_release_date_cached(value: str) -> datetime | None:
+    """
+    Parses an ISO 'YYYY-MM-DD' release date, falling back to parse_date for other formats.
+    Memoized on the raw string, as many movies share a release date.
+    Args:
+        value (str): String to parse as date.
+    Returns:
+        datetime | None: Parsed datetime or None if invalid.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse_date(value)
+
+
+def _parse_unique_values(values, parse) -> list:
+    """
+    Parses each distinct non-empty string of a column once, then maps the values to the results.
+    Args:
+        values: Raw column values, strings or missing values.
+        parse (Callable): Parser applied to each distinct string.
+    Returns:
+        list: Parsed values, None for missing, empty or invalid ones.
+    """
+    parsed = {value: parse(value) for value in set(values) if isinstance(value, str) and value}
+    return [parsed.get(value) for value in values]
+
+
+def _parse_dict_values(values) -> list:
     """
-    Parses specified columns in the DataFrame chunk as dictionaries using parse_dict.
+    Parses an iterable of raw values with the memoized parse_dict.
     Args:
-        chunk (pd.DataFrame): DataFrame containing columns to transform.
+        values: Raw column values, strings or missing values.
     Returns:
-        pd.DataFrame: DataFrame with parsed dictionary columns.
+        list: Parsed values, None for missing or invalid ones.
     """
-    dict_columns = [
-        "genres",
-        "keywords",
-        "production_companies",
-        "production_countries",
-        "spoken_languages",
-    ]
-    for col in dict_columns:
-        if col in chunk.columns:
-            chunk[col] = chunk[col].apply(parse_dict)
-    return chunk
+    return _parse_unique_values(values, _parse_dict_cached)
 
 
-def _transform_release_date(chunk: pd.DataFrame) -> pd.DataFrame:
+def _transform_dict_lists(columns: dict[str, list]) -> dict[str, list]:
     """
-    Parses the 'release_date' column in the DataFrame chunk into datetime objects using parse_date.
+    Parses specified column lists as dictionaries using parse_dict.
     Args:
-        chunk (pd.DataFrame): DataFrame containing the 'release_date' column.
+        columns (dict[str, list]): Column names mapped to lists of values.
     Returns:
-        pd.DataFrame: DataFrame with parsed release dates.
+        dict[str, list]: Columns with parsed dictionary lists.
     """
-    if "release_date" in chunk.columns:
-        chunk["release_date"] = chunk["release_date"].apply(parse_date)
-    return chunk
+    for col in _DICT_COLUMNS:
+        if col in columns:
+            columns[col] = _parse_dict_values(columns[col])
+    return columns
 
 
-def transform_movies(chunk: pd.DataFrame) -> pd.DataFrame:
+def _transform_release_date_list(columns: dict[str, list]) -> dict[str, list]:
     """
-    Applies a series of transformations to the movies DataFrame chunk.
-    Transforms dictionary columns and release date column using helper functions.
+    Parses the 'release_date' column list into datetime objects.
     Args:
-        chunk (pd.DataFrame): DataFrame to transform.
+        columns (dict[str, list]): Column names mapped to lists of values.
     Returns:
-        pd.DataFrame: Transformed DataFrame.
+        dict[str, list]: Columns with parsed release dates.
+    """
+    if "release_date" in columns:
+        columns["release_date"] = _parse_unique_values(
+            columns["release_date"], _parse_release_date_cached
+        )
+    return columns
+
+
+def transform_movies_columns(columns: dict[str, list]) -> dict[str, list]:
+    """
+    Applies the movies transformations to a chunk held as column lists, without building a DataFrame.
+    Args:
+        columns (dict[str, list]): Column names mapped to lists of values.
+    Returns:
+        dict[str, list]: Transformed columns.
     """
     for func in [
-        _transform_dict_columns,
-        _transform_release_date
+        _transform_dict_lists,
+        _transform_release_date_list
     ]:
-        chunk = func(chunk)
-    return chunk
+        columns = func(columns)
+    return columns
+
+
+def flatten_movies_columns(columns: dict[str, list]) -> dict[str, list | dict[str, list]]:
+    """
+    Flattens the parsed dictionary columns into one (movie, item) pair per related item,
+    ready to be sent to Neo4j as list parameters.
+    Each dictionary column is replaced by column lists holding the movie id under 'movie_id'
+    and the identifying item properties, without building one dict per pair.
+    Args:
+        columns (dict[str, list]): Movie columns processed by transform_movies_columns.
+    Returns:
+        dict[str, list | dict[str, list]]: Columns with flattened dictionary columns.
+    """
+    for col, keys in _RELATION_KEYS.items():
+        if col not in columns:
+            continue
+        rels = {"movie_id": [], **{key: [] for key in keys}}
+        for movie_id, items in zip(columns["id"], columns[col]):
+            for item in items or []:
+                rels["movie_id"].append(movie_id)
+                for key in keys:
+                    rels[key].append(item.get(key))
+        columns[col] = rels
+    return columns
@@ -1,5 +1,5 @@
 import ast
-import json
+import orjson
 import pandas as pd
 from dateutil import parser
 from datetime import datetime
@@ -8,6 +8,7 @@ from datetime import datetime
 def parse_dict(value: str) -> dict | None:
     """
     Safely parses a string representation of a dictionary into a Python dict.
+    The value is parsed as JSON first, and only evaluated as a Python literal if it is not valid JSON.
     Returns None if parsing fails or input is not a valid string.
     Args:
         value (str): String to parse.
@@ -17,6 +18,11 @@ def parse_dict(value: str) -> dict | None:
     if not isinstance(value, str) or not value.strip():
         return None
 
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        pass
+
     try:
         return ast.literal_eval(value)
     except (ValueError, SyntaxError):
@@ -60,19 +66,19 @@ def parse_date(value: str) -> datetime | None:
         return None
     
     
-def parse_json(value: str) -> dict | list | None:
+def parse_json(value: str | bytes) -> dict | list | None:
     """
-    Parses a JSON string into a Python dict or list.
+    Parses a JSON string or UTF-8 bytes into a Python dict or list.
     Returns None if parsing fails or input is not a valid string.
     Args:
-        value (str): JSON string to parse.
+        value (str | bytes): JSON string to parse.
     Returns:
         dict | list | None: Parsed object or None if invalid.
     """
-    if not isinstance(value, str) or not value.strip():
+    if not isinstance(value, (str, bytes)) or not value.strip():
         return None
     
     try:
-        return json.loads(value)
-    except (TypeError, ValueError, json.JSONDecodeError):
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
         return None
\ No newline at end of file
@@ -0,0 +1,136 @@
+import csv
+import os
+from datetime import datetime
+from app.pipelines.export_admin_import import write_admin_import_files
+
+
+def _read_rows(output_dir, name):
+    with open(os.path.join(output_dir, f"{name}.csv"), newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def _movies_chunk(**columns):
+    chunk = {
+        "id": [1],
+        "title": ["Alpha"],
+        "release_date": [datetime(2010, 1, 2)],
+        "runtime": [float("nan")],
+        "genres": [None],
+        "keywords": [None],
+        "production_companies": [None],
+        "production_countries": [None],
+        "spoken_languages": [None],
+    }
+    chunk.update(columns)
+    return chunk
+
+
+def _credits_chunk(movie_id, cast=None, crew=None):
+    return {"movie_id": [movie_id], "cast": [cast], "crew": [crew]}
+
+
+def test_movies_are_written_once_with_typed_header(tmp_path):
+    result = write_admin_import_files(
+        [_movies_chunk(), _movies_chunk(title=["Alpha again"])], [], str(tmp_path)
+    )
+
+    rows = _read_rows(tmp_path, "movies")
+    header = rows[0]
+    assert header[0] == "movie_id:ID(Movie)"
+    assert "release_date:localdatetime" in header
+    assert "runtime:double" in header
+    assert header[-1] == ":LABEL"
+
+    assert len(rows) == 2
+    movie = dict(zip(header, rows[1]))
+    assert movie["movie_id:ID(Movie)"] == "1"
+    assert movie["title"] == "Alpha"
+    assert movie["release_date:localdatetime"] == "2010-01-02T00:00:00"
+    assert movie["runtime:double"] == ""
+    assert movie["tagline"] == ""
+    assert movie[":LABEL"] == "Movie"
+    assert result["movies"] == 1
+    assert str(tmp_path / "movies.csv") in result["nodes"]
+
+
+def test_related_nodes_are_shared_and_linked_once(tmp_path):
+    chunk = _movies_chunk(
+        id=[1, 2],
+        title=["Alpha", "Beta"],
+        release_date=[None, None],
+        runtime=[None, None],
+        genres=[[{"name": "Drama"}, {"name": "Drama"}], [{"name": "Drama"}, {"name": "Comedy"}]],
+        keywords=[None, []],
+        production_companies=[None, None],
+        production_countries=[[{"iso_3166_1": "US", "name": "United States"}], None],
+        spoken_languages=[None, None],
+    )
+    write_admin_import_files([chunk], [], str(tmp_path))
+
+    assert _read_rows(tmp_path, "genre") == [
+        [":ID(Genre)", "name", "name_lc", ":LABEL"],
+        ["0", "Drama", "drama", "Genre"],
+        ["1", "Comedy", "comedy", "Genre"],
+    ]
+    assert _read_rows(tmp_path, "has_genre") == [
+        [":START_ID(Movie)", ":END_ID(Genre)", ":TYPE"],
+        ["1", "0", "HAS_GENRE"],
+        ["2", "0", "HAS_GENRE"],
+        ["2", "1", "HAS_GENRE"],
+    ]
+    assert _read_rows(tmp_path, "has_keyword") == [[":START_ID(Movie)", ":END_ID(Keyword)", ":TYPE"]]
+    assert _read_rows(tmp_path, "country") == [
+        [":ID(Country)", "iso_code", "name", "iso_code_lc", ":LABEL"],
+        ["0", "US", "United States", "us", "Country"],
+    ]
+    # Languages have no lowercase copy
+    assert _read_rows(tmp_path, "language")[0] == [":ID(Language)", "iso_code", "name", ":LABEL"]
+
+
+def test_credits_keep_first_person_and_last_relationship(tmp_path):
+    credits = [
+        _credits_chunk(
+            1,
+            cast=[
+                {"id": 10, "name": "Ann Lee", "gender": 1, "character": "Hero"},
+                {"id": 10, "name": "Ann Lee", "gender": 1, "character": "Villain"},
+            ],
+            crew=[
+                {"id": 20, "name": "Bob", "gender": None, "job": "DIRECTOR"},
+                {
+                    "id": 30, "name": "Cy", "gender": 2,
+                    "job": "Writer", "department": "Writing", "credit_id": "a",
+                },
+            ],
+        ),
+        _credits_chunk(
+            1,
+            cast=[{"id": 30, "name": "Renamed", "gender": 0, "character": None}],
+            crew=[{"id": 30, "name": "Cy", "job": "Editor", "department": "Editing", "credit_id": "b"}],
+        ),
+        # Credits of movies that were not imported are skipped
+        _credits_chunk(99, cast=[{"id": 40, "name": "Nobody", "character": "Ghost"}]),
+    ]
+    result = write_admin_import_files([_movies_chunk()], credits, str(tmp_path))
+
+    assert result["credits"] == 2
+    assert _read_rows(tmp_path, "persons") == [
+        ["person_id:ID(Person)", "name", "name_lc", "gender:long", ":LABEL"],
+        ["10", "Ann Lee", "ann lee", "1", "Person"],
+        ["20", "Bob", "bob", "", "Person"],
+        ["30", "Cy", "cy", "2", "Person"],
+    ]
+    assert _read_rows(tmp_path, "acted_in") == [
+        [":START_ID(Person)", ":END_ID(Movie)", "character", ":TYPE"],
+        ["10", "1", "Villain", "ACTED_IN"],
+        ["30", "1", "", "ACTED_IN"],
+    ]
+    assert _read_rows(tmp_path, "directed") == [
+        [":START_ID(Person)", ":END_ID(Movie)", ":TYPE"],
+        ["20", "1", "DIRECTED"],
+    ]
+    assert _read_rows(tmp_path, "contributed_to") == [
+        [":START_ID(Person)", ":END_ID(Movie)", "job", "department", "credit_id", ":TYPE"],
+        ["30", "1", "Editor", "Editing", "b", "CONTRIBUTED_TO"],
+    ]
+    assert str(tmp_path / "acted_in.csv") in result["relationships"]
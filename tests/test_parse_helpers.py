@@ -0,0 +1,20 @@
+from app.utils.parse_helpers import parse_dict
+
+
+def test_parse_dict_json():
+    assert parse_dict('[{"id": 28, "name": "Action"}]') == [{"id": 28, "name": "Action"}]
+
+
+def test_parse_dict_python_literal():
+    assert parse_dict("[{'id': 1, 'name': \"Ocean's\"}]") == [{"id": 1, "name": "Ocean's"}]
+
+
+def test_parse_dict_keeps_double_quotes_inside_python_strings():
+    value = [{"name": 'The "Best" Co'}]
+    assert parse_dict(repr(value)) == value
+
+
+def test_parse_dict_invalid():
+    assert parse_dict("not a dict") is None
+    assert parse_dict("   ") is None
+    assert parse_dict(None) is None
@@ -0,0 +1,58 @@
+import pyarrow as pa
+import pytest
+from app.pipelines import read_csv
+from app.pipelines.read_csv import read_csv_chunks
+
+
+# Columns read from the sample file, leaving out its 'extra' column
+_COLUMNS = {"id": pa.int64(), "title": pa.string()}
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "movies.csv"
+    rows = ["id,title,extra", '1,"Multi\nline",x', "2,,y"]
+    rows += [f"{i},Title {i},z" for i in range(3, 11)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _ids(chunks):
+    return [value for chunk in chunks for value in chunk["id"]]
+
+
+def test_read_csv_chunks_yields_chunks_of_chunk_size(csv_path):
+    chunks = list(read_csv_chunks(csv_path, 3, _COLUMNS))
+
+    assert [len(chunk["id"]) for chunk in chunks] == [3, 3, 3, 1]
+    assert _ids(chunks) == list(range(1, 11))
+    assert list(chunks[0]) == ["id", "title"]
+    # Quoted newlines are kept and empty strings are read as None
+    assert chunks[0]["title"] == ["Multi\nline", None, "Title 3"]
+
+
+def test_read_csv_chunks_rechunks_across_arrow_blocks(csv_path, monkeypatch):
+    # Blocks of a few rows each, so chunks span several blocks
+    monkeypatch.setattr(read_csv, "_CSV_BLOCK_SIZE", 32)
+
+    chunks = list(read_csv_chunks(csv_path, 4, _COLUMNS))
+
+    assert [len(chunk["id"]) for chunk in chunks] == [4, 4, 2]
+    assert _ids(chunks) == list(range(1, 11))
+
+
+@pytest.mark.parametrize(
+    "limit, expected",
+    [
+        (5, [[1, 2], [3, 4], [5]]),
+        (4, [[1, 2], [3, 4]]),
+        (100, [[1, 2], [3, 4], [5, 6], [7, 8], [9, 10]]),
+        (0, []),
+    ],
+)
+def test_read_csv_chunks_stops_at_limit(csv_path, monkeypatch, limit, expected):
+    monkeypatch.setattr(read_csv, "_CSV_BLOCK_SIZE", 32)
+
+    chunks = list(read_csv_chunks(csv_path, 2, _COLUMNS, limit=limit))
+
+    assert [chunk["id"] for chunk in chunks] == expected
@@ -0,0 +1,74 @@
+from app.pipelines.transform_credits import flatten_credits_columns, transform_credits_columns
+
+
+def test_transform_credits_columns_parses_json_and_skips_missing_values():
+    cast = '[{"id": 10, "name": "Ann", "character": "Hero"}]'
+    columns = {"movie_id": [1, 2, 3], "cast": [cast, cast, None], "crew": ["[]", "", "not json"]}
+
+    transformed = transform_credits_columns(columns)
+
+    assert transformed["cast"] == [[{"id": 10, "name": "Ann", "character": "Hero"}]] * 2 + [None]
+    assert transformed["crew"] == [[], None, None]
+
+
+def test_flatten_credits_columns_splits_cast_directors_and_contributors():
+    columns = {
+        "movie_id": [1, 2],
+        "cast": [[{"id": 10, "name": "Ann", "gender": 1, "character": "Hero", "order": 0}], None],
+        "crew": [
+            [
+                {
+                    "id": 20, "name": "Bob", "gender": 2,
+                    "job": "Director", "department": "Directing", "credit_id": "a",
+                },
+                {
+                    "id": 30, "name": "Cy", "gender": 0,
+                    "job": "Writer", "department": "Writing", "credit_id": "b",
+                },
+            ],
+            [],
+        ],
+    }
+
+    flattened = flatten_credits_columns(columns)
+
+    assert flattened["movie_id"] == [1, 2]
+    assert "crew" not in flattened
+    assert flattened["cast"] == [
+        {"movie_id": 1, "person_id": 10, "name": "Ann", "gender": 1, "character": "Hero"},
+    ]
+    assert flattened["directors"] == [
+        {
+            "movie_id": 1, "person_id": 20, "name": "Bob", "gender": 2,
+            "job": "Director", "department": "Directing", "credit_id": "a",
+        },
+    ]
+    assert flattened["contributors"] == [
+        {
+            "movie_id": 1, "person_id": 30, "name": "Cy", "gender": 0,
+            "job": "Writer", "department": "Writing", "credit_id": "b",
+        },
+    ]
+
+
+def test_flatten_credits_columns_matches_directors_case_insensitively():
+    columns = {
+        "movie_id": [1],
+        "cast": [[]],
+        "crew": [[
+            {"id": 20, "name": "Bob", "job": "DIRECTOR"},
+            {"id": 30, "name": "Cy", "job": None},
+        ]],
+    }
+
+    flattened = flatten_credits_columns(columns)
+
+    assert [row["person_id"] for row in flattened["directors"]] == [20]
+    assert [row["person_id"] for row in flattened["contributors"]] == [30]
+    assert flattened["contributors"][0]["department"] is None
+
+
+def test_flatten_credits_columns_without_credits():
+    flattened = flatten_credits_columns({"movie_id": [1], "cast": [None], "crew": [None]})
+
+    assert flattened == {"movie_id": [1], "cast": [], "directors": [], "contributors": []}
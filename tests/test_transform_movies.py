@@ -0,0 +1,72 @@
+from datetime import datetime
+from app.pipelines.transform_movies import (
+    _parse_unique_values,
+    flatten_movies_columns,
+    transform_movies_columns,
+)
+
+
+def test_parse_unique_values_parses_each_distinct_string_once():
+    calls = []
+
+    def parse(value):
+        calls.append(value)
+        return value.upper()
+
+    parsed = _parse_unique_values(["a", "b", "a", None, "", "b"], parse)
+
+    assert parsed == ["A", "B", "A", None, None, "B"]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_transform_movies_columns_parses_lists_and_dates():
+    columns = {
+        "id": [1, 2, 3],
+        "genres": ['[{"id": 18, "name": "Drama"}]', None, ""],
+        "release_date": ["2010-07-15", None, "July 15, 2010"],
+    }
+
+    transformed = transform_movies_columns(columns)
+
+    assert transformed["genres"] == [[{"id": 18, "name": "Drama"}], None, None]
+    # Dates not in ISO format fall back to parse_date
+    assert transformed["release_date"] == [datetime(2010, 7, 15), None, datetime(2010, 7, 15)]
+
+
+def test_flatten_movies_columns_splits_relations_into_column_lists():
+    columns = {
+        "id": [1, 2],
+        "title": ["Alpha", "Beta"],
+        "genres": [
+            [{"id": 18, "name": "Drama"}, {"id": 35, "name": "Comedy"}],
+            [{"id": 18, "name": "Drama"}],
+        ],
+        "production_countries": [[{"iso_3166_1": "US", "name": "United States of America"}], None],
+        "spoken_languages": [[], [{"iso_639_1": "fr", "name": "Français"}]],
+    }
+
+    flattened = flatten_movies_columns(columns)
+
+    assert flattened["title"] == ["Alpha", "Beta"]
+    assert flattened["genres"] == {
+        "movie_id": [1, 1, 2],
+        "name": ["Drama", "Comedy", "Drama"],
+    }
+    assert flattened["production_countries"] == {
+        "movie_id": [1],
+        "iso_3166_1": ["US"],
+        "name": ["United States of America"],
+    }
+    assert flattened["spoken_languages"] == {
+        "movie_id": [2],
+        "iso_639_1": ["fr"],
+        "name": ["Français"],
+    }
+    # Relation columns missing from the chunk are not added
+    assert "keywords" not in flattened
+
+
+def test_flatten_movies_columns_keeps_missing_item_properties_as_none():
+    columns = {"id": [1], "keywords": [[{"id": 7}]]}
+
+    assert flatten_movies_columns(columns)["keywords"] == {"movie_id": [1], "name": [None]}